@@ -4,6 +4,7 @@ Command-line interface for the Indonesian Bank Statement PDF Parser.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -52,13 +53,13 @@ Examples:
     
     args = parser.parse_args()
     
-    # Validate input file
-    pdf_path = Path(args.pdf_file)
-    if not pdf_path.exists():
+    # Validate input file (plain string checks, no Path object needed)
+    pdf_path = args.pdf_file
+    if not os.path.isfile(pdf_path):
         print(f"Error: File not found: {pdf_path}", file=sys.stderr)
         sys.exit(1)
     
-    if not pdf_path.suffix.lower() == ".pdf":
+    if not pdf_path.lower().endswith(".pdf"):
         print(f"Warning: File may not be a PDF: {pdf_path}", file=sys.stderr)
     
     try:
@@ -66,7 +67,7 @@ Examples:
         if args.verbose:
             print(f"Parsing: {pdf_path}")
         
-        result = parse_pdf(str(pdf_path))
+        result = parse_pdf(pdf_path)
         
         # Display results if verbose
         if args.verbose:
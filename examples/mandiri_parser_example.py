@@ -5,51 +5,97 @@ This shows how to extend the parser to support additional Indonesian banks.
 """
 
 import re
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Sequence, Union
 
-import pdfplumber
+from pdfparser._backends import get_page_text
+from pdfparser.base import (
+    BaseBankParser,
+    PagedParserMixin,
+    StatementMetadata,
+    Transaction,
+    ParseResult,
+    _open_pdf,
+)
 
-from pdfparser.base import BaseBankParser, StatementMetadata, Transaction, ParseResult
 
+# Metadata fields, combined into one pattern so the header text is scanned
+# once. Each field is a named group matching a StatementMetadata attribute,
+# with its value captured in "<attribute>_value". Add new fields here.
+# Each alternative is a zero-width lookahead, so a field value can't swallow
+# the label of the next field (e.g. a redacted "No. Rekening : Tanggal
+# Cetak : ..."). (adjust based on actual Mandiri format)
+_METADATA_RE = re.compile(
+    r'(?=(?P<statement_date>Tanggal Cetak\s*:\s*'
+    r'(?P<statement_date_value>\d{2}/\d{2}/\d{4})))'
+    r'|(?=(?P<account_number>No\. Rekening\s*:\s*(?P<account_number_value>\S+)))'
+)
 
-class MandiriParser(BaseBankParser):
+# Table detection tuned to the transaction table's ruled grid
+# (adjust based on actual Mandiri format)
+_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "min_words_vertical": 3,
+}
+
+# Date | Description | Ref | Debit | Credit | Balance
+_MIN_TABLE_COLUMNS = 6
+
+
+def _transactions_from_columns(columns: Sequence[Sequence[Any]]) -> List[Transaction]:
+    """
+    Build Transactions from per-field columns (struct of arrays).
+    
+    Args:
+        columns: One sequence per Transaction field, in field order, all of
+            the same length.
+        
+    Returns:
+        One Transaction per row, constructed without per-row keyword dicts.
+    """
+    return list(map(Transaction, *columns))
+
+
+class MandiriParser(PagedParserMixin, BaseBankParser):
     """
     Example parser for Bank Mandiri statements.
     
     This is a template showing how to implement support for additional banks.
+    
+    Only the pages that are needed have to be parsed: pass e.g.
+    ``{"page_range": [1]}`` in the config to load just the first page (as
+    with ``pdfplumber.open(path, pages=[1])``). Page numbers are 1-based.
     """
     
-    @property
-    def bank_name(self) -> str:
-        """Return the name of the bank this parser handles."""
-        return "Mandiri"
+    bank_name = "Mandiri"
+    
+    # Bank indicators compiled into a single pattern at import time so
+    # detection is one scan over the page text. "Mandiri" subsumes
+    # "BANK MANDIRI" and "PT BANK MANDIRI"; for banks with several distinct
+    # keywords use an alternation, e.g. r'KEYWORD ONE|KEYWORD TWO'.
+    _INDICATOR_RE = re.compile(r'\bMandiri\b', re.IGNORECASE)
     
-    def can_parse(self, pdf_path: Union[str, Path]) -> bool:
+    def can_parse(self, pdf_path: Union[str, Path], pdf: Optional[Any] = None) -> bool:
         """Check if this parser can handle the given PDF."""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                if not pdf.pages:
-                    return False
-                
-                text = pdf.pages[0].extract_text() or ""
-                # Look for Mandiri-specific indicators
-                mandiri_indicators = [
-                    "PT BANK MANDIRI",
-                    "BANK MANDIRI",
-                    "Mandiri",
-                    # Add more specific patterns here
-                ]
-                return any(indicator in text for indicator in mandiri_indicators)
+            # Detection only needs raw text, not pdfplumber's layout analysis
+            text = get_page_text(pdf_path, 0, pdf)
+            # Look for Mandiri-specific indicators
+            return self._INDICATOR_RE.search(text) is not None
         except Exception:
             return False
     
-    def parse(self, pdf_path: Union[str, Path]) -> ParseResult:
+    def parse(
+        self, pdf_path: Union[str, Path], pdf: Optional[Any] = None
+    ) -> ParseResult:
         """
         Parse a Mandiri bank statement PDF.
         
         Args:
             pdf_path: Path to the PDF file.
+            pdf: Optional already opened pdfplumber PDF for ``pdf_path``.
             
         Returns:
             ParseResult containing metadata and transactions.
@@ -58,16 +104,19 @@ class MandiriParser(BaseBankParser):
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
-        with pdfplumber.open(pdf_path) as pdf:
-            # Extract metadata from first page header
-            metadata = self._extract_metadata(pdf.pages[0])
+        with ExitStack() as stack:
+            if pdf is None:
+                pdf = stack.enter_context(_open_pdf(pdf_path, self.config))
+            
+            # Extract metadata from first page header (plain text is enough,
+            # so skip pdfplumber's layout analysis)
+            header_text = get_page_text(pdf_path, pdf.pages[0].page_number - 1, pdf)
+            metadata = self._extract_metadata(header_text)
             metadata.bank_name = self.bank_name
             
-            # Extract transactions from all pages
-            transactions = []
-            for page in pdf.pages:
-                page_transactions = self._extract_transactions(page)
-                transactions.extend(page_transactions)
+            # Extract transactions from all pages (BaseBankParser runs
+            # _extract_transactions per page, across num_workers processes)
+            transactions = self._extract_all_transactions(pdf_path, pdf)
             
             # Extract summary from last page
             summary = self._extract_summary(pdf.pages[-1])
@@ -78,9 +127,8 @@ class MandiriParser(BaseBankParser):
             summary=summary
         )
     
-    def _extract_metadata(self, page) -> StatementMetadata:
-        """Extract metadata from the first page header section."""
-        text = page.extract_text()
+    def _extract_metadata(self, text: str) -> StatementMetadata:
+        """Extract metadata from the first page header text."""
         if not text:
             return StatementMetadata()
         
@@ -88,49 +136,53 @@ class MandiriParser(BaseBankParser):
         
         # Implement Mandiri-specific metadata extraction
         # This would need to be customized based on Mandiri's PDF format
-        
-        # Example patterns (adjust based on actual Mandiri format):
-        # Statement Date
-        date_match = re.search(r'Tanggal Cetak\s*:\s*(\d{2}/\d{2}/\d{4})', text)
-        if date_match:
-            metadata.statement_date = date_match.group(1)
-        
-        # Account Number
-        account_match = re.search(r'No\. Rekening\s*:\s*(\S+)', text)
-        if account_match:
-            metadata.account_number = account_match.group(1)
+        self._apply_patterns(metadata, text)
         
         # Add more Mandiri-specific parsing here...
         
         return metadata
     
+    def _apply_patterns(self, metadata: StatementMetadata, text: str) -> None:
+        """Fill metadata fields from their first match in a single pass."""
+        for match in _METADATA_RE.finditer(text):
+            field_name = match.lastgroup
+            if field_name and getattr(metadata, field_name) is None:
+                setattr(metadata, field_name, match.group(f"{field_name}_value"))
+    
     def _extract_transactions(self, page) -> List[Transaction]:
         """Extract transactions from a page."""
         # Implement Mandiri-specific transaction extraction
         # This would need to be customized based on Mandiri's table format
         
-        transactions = []
-        
         # Example implementation - adjust based on actual format
-        tables = page.extract_tables()
+        rows = []
+        # Locate tables first and only extract text from the ones wide enough
+        # to be the transaction table
+        found = page.find_tables(table_settings=_TABLE_SETTINGS)
+        tables = [t for t in found if len(t.columns) >= _MIN_TABLE_COLUMNS]
         for table in tables:
-            for row in table[1:]:  # Skip header
-                if len(row) >= 6:  # Ensure enough columns
-                    try:
-                        transaction = Transaction(
-                            transaction_date=row[0] or "",
-                            transaction_time=None,  # If Mandiri doesn't have time
-                            description=row[1] or "",
-                            teller_user_id=row[2] or "",
-                            debit=self._parse_amount(row[3] or "0"),
-                            credit=self._parse_amount(row[4] or "0"),
-                            balance=self._parse_amount(row[5] or "0")
-                        )
-                        transactions.append(transaction)
-                    except (ValueError, IndexError):
-                        continue
+            for row in table.extract()[1:]:  # Skip header
+                if len(row) >= _MIN_TABLE_COLUMNS:  # Ensure enough columns
+                    rows.append(row)
         
-        return transactions
+        if not rows:
+            return []
+        
+        # Convert all of the page's amounts (debit, credit, balance) in one
+        # vectorized pass, then build the page column by column
+        amounts = self._parse_amount_column(
+            [value for row in rows for value in row[3:6]]
+        )
+        debits, credits, balances = amounts.reshape(-1, 3).T.tolist()
+        return _transactions_from_columns([
+            [row[0] or "" for row in rows],  # transaction_date
+            [None] * len(rows),  # transaction_time (if Mandiri doesn't have time)
+            [row[1] or "" for row in rows],  # description
+            [row[2] or "" for row in rows],  # teller_user_id
+            debits,
+            credits,
+            balances,
+        ])
     
     def _extract_summary(self, page) -> Dict[str, Any]:
         """Extract summary information from the last page."""
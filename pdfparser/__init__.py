@@ -1,23 +1,52 @@
 """
 Indonesian Bank Statement PDF Parser
 
-A high-performance Python module for extracting structured data 
+A high-performance Python module for extracting structured data
 from Indonesian bank statement PDFs supporting multiple bank formats.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import StatementMetadata, Transaction, ParseResult, BaseBankParser
-from .parser import BRIParser
-from .factory import parse_pdf, get_supported_banks, PDFParser, ParserFactory
+
+if TYPE_CHECKING:
+    from .parser import BRIParser
+    from .factory import (
+        parse_pdf, parse_pdfs, get_supported_banks, PDFParser, ParserFactory
+    )
 
 __version__ = "1.0.0"
 __all__ = [
-    "PDFParser", 
+    "PDFParser",
     "BRIParser",
     "ParserFactory",
-    "parse_pdf", 
+    "parse_pdf",
+    "parse_pdfs",
     "get_supported_banks",
-    "StatementMetadata", 
-    "Transaction", 
+    "StatementMetadata",
+    "Transaction",
     "ParseResult",
     "BaseBankParser"
 ]
+
+# Parser and factory exports are loaded on first access (PEP 562), so e.g.
+# ``bank-statement-parser --version`` doesn't import every parser module
+_LAZY_EXPORTS = {
+    "BRIParser": ".parser",
+    "PDFParser": ".factory",
+    "ParserFactory": ".factory",
+    "parse_pdf": ".factory",
+    "parse_pdfs": ".factory",
+    "get_supported_banks": ".factory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load lazily exported names on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,183 @@
+"""
+Text extraction backends.
+
+pdfplumber (pdfminer.six underneath) runs full layout analysis for every
+page it reads. Call sites that only need a page's plain text, such as the
+example Mandiri parser's detection and header metadata, go through
+``get_page_text`` instead, which prefers the much faster pypdfium2 and
+falls back to pdfplumber when it is not installed. Table extraction stays
+on pdfplumber; word extraction can opt in to pypdfium2 through
+``get_page_words``.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Sequence, Union
+
+from .base import _page_text
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# pdfplumber's default extract_words tolerances, in points
+_X_TOLERANCE = 3.0
+_Y_TOLERANCE = 3.0
+
+
+class PageWords(NamedTuple):
+    """
+    Words of one page as parallel arrays, in the page's text order.
+    
+    ``x0`` and ``top`` use pdfplumber's coordinate system (points from the
+    left and top edges of the page).
+    """
+    x0: "np.ndarray"
+    top: "np.ndarray"
+    text: List[str]
+
+
+def _import_pdfium() -> Optional[Any]:
+    """Return the pypdfium2 module, or None if it is not installed."""
+    try:
+        # Installed with pdfplumber >= 0.11
+        import pypdfium2 as pdfium
+    except ImportError:  # pragma: no cover - depends on installed pdfplumber
+        return None
+    return pdfium
+
+
+def get_page_text(
+    pdf_path: Union[str, Path], page_index: int = 0, pdf: Optional[Any] = None
+) -> str:
+    """
+    Return the plain text of one page.
+    
+    Args:
+        pdf_path: Path to the PDF file.
+        page_index: 0-based index of the page in the document.
+        pdf: Optional already opened pdfplumber PDF for ``pdf_path``, reused
+            by the pdfplumber fallback if it has the page loaded.
+        
+    Returns:
+        The page text (empty if the page has none).
+    """
+    pdfium = _import_pdfium()
+    if pdfium is not None:
+        return _get_page_text_pdfium(pdfium, pdf_path, page_index)
+    
+    if pdf is not None:
+        for page in pdf.pages:
+            if page.page_number == page_index + 1:
+                return _page_text(page)
+    
+    import pdfplumber
+    
+    with pdfplumber.open(pdf_path, pages=[page_index + 1]) as pdf:
+        return _page_text(pdf.pages[0])
+
+
+def get_page_words(
+    pdf_path: Union[str, Path], page_indices: Sequence[int]
+) -> Optional[List[PageWords]]:
+    """
+    Extract the words of several pages with pypdfium2.
+    
+    Characters are read straight into NumPy arrays and split into words
+    with pdfplumber's rules (whitespace in the content stream, or a glyph
+    more than 3pt after the previous one, behind it or on another line),
+    without building a dict per character or word. The spaces and line
+    breaks pdfium generates itself are dropped first, as pdfplumber never
+    sees them.
+    
+    Args:
+        pdf_path: Path to the PDF file.
+        page_indices: 0-based indices of the pages to read.
+        
+    Returns:
+        One PageWords per requested page, or None if pypdfium2 is not
+        installed (callers fall back to pdfplumber).
+    """
+    pdfium = _import_pdfium()
+    if pdfium is None:
+        return None
+    
+    document = pdfium.PdfDocument(str(pdf_path))
+    try:
+        return [
+            _get_page_words_pdfium(pdfium, document[index]) for index in page_indices
+        ]
+    finally:
+        document.close()
+
+
+def _get_page_words_pdfium(pdfium: Any, page: Any) -> PageWords:
+    """Read one pypdfium2 page's words into a PageWords."""
+    import numpy as np
+    
+    textpage = page.get_textpage()
+    try:
+        n = textpage.count_chars()
+        text = str(textpage.get_text_range())
+        if len(text) != n:
+            # Characters outside the BMP; read them one at a time
+            text = "".join(textpage.get_text_range(i, 1) for i in range(n))
+        # Font-based ("loose") boxes, which line up with pdfminer's
+        boxes = np.empty((n, 4), dtype=np.float64)
+        generated = np.zeros(n, dtype=bool)
+        for i in range(n):
+            boxes[i] = textpage.get_charbox(i, loose=True)
+            generated[i] = pdfium.raw.FPDFText_IsGenerated(textpage.raw, i) == 1
+        height = float(page.get_height())
+    finally:
+        textpage.close()
+        page.close()
+    
+    if n == 0:
+        return PageWords(np.empty(0), np.empty(0), [])
+    
+    chars = np.array(list(text))
+    space = np.char.isspace(chars) & ~generated
+    keep = ~np.char.isspace(chars) & ~generated
+    x0 = boxes[keep, 0]
+    x1 = boxes[keep, 2]
+    top = height - boxes[keep, 3]
+    if not len(x0):
+        return PageWords(x0, top, [])
+    
+    # A word starts after real whitespace, or where the next glyph isn't
+    # within tolerance after the previous one on the same line (pdfplumber's
+    # WordExtractor.char_begins_new_word for left-to-right text)
+    spaces_before = np.cumsum(space)[np.flatnonzero(keep)]
+    starts = np.ones(len(x0), dtype=bool)
+    starts[1:] = (
+        (np.diff(spaces_before) > 0)
+        | (x0[1:] < x0[:-1])
+        | (x0[1:] > x1[:-1] + _X_TOLERANCE)
+        | (np.abs(top[1:] - top[:-1]) > _Y_TOLERANCE)
+    )
+    bounds = np.flatnonzero(starts)
+    
+    kept = "".join(chars[keep].tolist())
+    ends = np.append(bounds[1:], len(kept)).tolist()
+    words = [kept[start:end] for start, end in zip(bounds.tolist(), ends)]
+    return PageWords(
+        np.minimum.reduceat(x0, bounds),
+        np.minimum.reduceat(top, bounds),
+        words,
+    )
+
+
+def _get_page_text_pdfium(
+    pdfium: Any, pdf_path: Union[str, Path], page_index: int
+) -> str:
+    """Read one page's text with pypdfium2."""
+    document = pdfium.PdfDocument(str(pdf_path))
+    try:
+        page = document[page_index]
+        textpage = page.get_textpage()
+        try:
+            return str(textpage.get_text_range())
+        finally:
+            textpage.close()
+            page.close()
+    finally:
+        document.close()
@@ -2,12 +2,127 @@
 Base classes and interfaces for bank statement parsers.
 """
 
+import csv
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Dict,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-import pandas as pd
+if TYPE_CHECKING:
+    # numpy and pandas are imported where they are used, so importing the
+    # package (e.g. for ``--version``) does not pay their start-up cost
+    import numpy as np
+    import pandas as pd
+
+
+# Thousand separators dropped from amount strings (comma, no-break space);
+# other whitespace is only stripped from the ends, so "1,000 500" stays invalid
+_AMOUNT_TRANS = str.maketrans("", "", ",\xa0")
+
+
+def _file_signature(pdf_path: Union[str, Path]) -> Optional[Tuple[str, int, int]]:
+    """
+    Cache key for a file's current contents: (absolute path, mtime in ns, size).
+    
+    Returns None if the file can't be stat'ed (e.g. it doesn't exist).
+    """
+    try:
+        stat = os.stat(pdf_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _open_pdf(
+    pdf_path: Union[str, Path],
+    config: Optional[Dict[str, Any]] = None,
+    pages: Optional[Sequence[int]] = None,
+) -> Any:
+    """
+    Open a PDF with pdfplumber, honoring the ``page_range``/``laparams`` config.
+    
+    ``pages`` (1-based page numbers) overrides ``config["page_range"]``.
+    """
+    import pdfplumber
+    
+    config = config or {}
+    if pages is None:
+        pages = config.get("page_range")
+    return pdfplumber.open(
+        pdf_path,
+        pages=list(pages) if pages is not None else None,
+        laparams=config.get("laparams"),
+    )
+
+
+def _page_text(page: Any) -> str:
+    """``page.extract_text()``, memoized on the pdfplumber page object."""
+    text = page.__dict__.get("_cached_text")
+    if text is None:
+        text = str(page.extract_text() or "")
+        page._cached_text = text
+    return str(text)
+
+
+def _page_words(
+    page: Any, settings: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    ``page.extract_words(**settings)``, memoized on the pdfplumber page object.
+    
+    The words are extracted again only if called with different settings.
+    """
+    settings = settings or {}
+    key = tuple(sorted(settings.items()))
+    cached = page.__dict__.get("_cached_words")
+    if cached is None or cached[0] != key:
+        cached = (key, page.extract_words(**settings))
+        page._cached_words = cached
+    return list(cached[1])
+
+
+def _release_page(page: Any) -> None:
+    """Drop a pdfplumber page's cached layout, text and words."""
+    page.__dict__.pop("_cached_text", None)
+    page.__dict__.pop("_cached_words", None)
+    page.close()
+
+
+def _concat_page_transactions(
+    results: Sequence[Sequence["Transaction"]]
+) -> List["Transaction"]:
+    """
+    Concatenate per-page transaction lists into one list.
+    
+    The result is allocated once at its final size and filled by slice
+    assignment, instead of growing through repeated ``extend`` calls.
+    """
+    total = sum(map(len, results))
+    transactions: List[Any] = [None] * total
+    i = 0
+    for page_transactions in results:
+        n = len(page_transactions)
+        transactions[i:i + n] = page_transactions
+        i += n
+    return transactions
 
 
 @dataclass
@@ -44,7 +159,22 @@ class StatementMetadata:
 
 @dataclass
 class Transaction:
-    """A single transaction from the statement."""
+    """
+    A single transaction from the statement.
+    
+    Uses ``__slots__`` (no per-instance ``__dict__``) since statements can
+    hold many thousands of rows.
+    """
+    __slots__ = (
+        "transaction_date",
+        "transaction_time",
+        "description",
+        "teller_user_id",
+        "debit",
+        "credit",
+        "balance",
+    )
+    
     transaction_date: str
     transaction_time: Optional[str]
     description: str
@@ -54,6 +184,56 @@ class Transaction:
     balance: float
 
 
+# Transaction column headers and the matching fields, in DataFrame/CSV order
+_TRANSACTION_HEADERS = (
+    "Transaction Date",
+    "Transaction Time",
+    "Description",
+    "Teller/User ID",
+    "Debit",
+    "Credit",
+    "Balance",
+)
+_TRANSACTION_FIELDS = attrgetter(
+    "transaction_date",
+    "transaction_time",
+    "description",
+    "teller_user_id",
+    "debit",
+    "credit",
+    "balance",
+)
+
+
+def _write_transactions_csv(
+    transactions_path: Union[str, Path], transactions: Iterable[Transaction]
+) -> int:
+    """
+    Write transactions to CSV row by row with the standard library writer.
+    
+    ``transactions`` may be a generator; rows are written as it yields them.
+    The first item is pulled before the file is opened, so a generator that
+    fails up front (e.g. the PDF is missing) leaves no header-only CSV.
+    
+    Returns:
+        The number of transactions written.
+    """
+    rows = iter(transactions)
+    first = next(rows, None)
+    if first is not None:
+        rows = chain((first,), rows)
+    
+    count = 0
+    with open(transactions_path, "w", newline="", encoding="utf-8") as f:
+        # Same line endings as DataFrame.to_csv, which this replaces
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(_TRANSACTION_HEADERS)
+        for transaction in rows:
+            writer.writerow(_TRANSACTION_FIELDS(transaction))
+            count += 1
+    return count
+
+
 @dataclass
 class ParseResult:
     """Result of parsing a bank statement PDF."""
@@ -61,63 +241,270 @@ class ParseResult:
     transactions: List[Transaction]
     summary: Dict[str, Any] = field(default_factory=dict)
     
-    def get_metadata_df(self) -> pd.DataFrame:
+    def get_metadata_df(self) -> "pd.DataFrame":
         """Get metadata as a pandas DataFrame (single row)."""
+        import pandas as pd
+        
         return pd.DataFrame([self.metadata.to_dict()])
     
-    def get_transactions_df(self) -> pd.DataFrame:
+    def get_transactions_df(self) -> "pd.DataFrame":
         """Get transactions as a pandas DataFrame."""
-        data = []
-        for t in self.transactions:
-            data.append({
-                "Transaction Date": t.transaction_date,
-                "Transaction Time": t.transaction_time,
-                "Description": t.description,
-                "Teller/User ID": t.teller_user_id,
-                "Debit": t.debit,
-                "Credit": t.credit,
-                "Balance": t.balance,
-            })
-        return pd.DataFrame(data)
-    
-    def export_to_csv(self, metadata_path: str, transactions_path: str) -> None:
-        """Export parsed data to CSV files."""
+        import numpy as np
+        import pandas as pd
+        
+        cols = self._transaction_columns()
+        return pd.DataFrame({
+            "Transaction Date": cols[0],
+            "Transaction Time": cols[1],
+            "Description": cols[2],
+            "Teller/User ID": cols[3],
+            "Debit": np.asarray(cols[4], dtype="float64"),
+            "Credit": np.asarray(cols[5], dtype="float64"),
+            "Balance": np.asarray(cols[6], dtype="float64"),
+        })
+    
+    def export_to_csv(
+        self, metadata_path: str, transactions_path: str, engine: str = "csv"
+    ) -> None:
+        """
+        Export parsed data to CSV files.
+        
+        Args:
+            metadata_path: Path of the metadata CSV file.
+            transactions_path: Path of the transactions CSV file.
+            engine: Transactions writer. "csv" (default) streams rows with
+                ``csv.writer`` and produces the same text as
+                ``get_transactions_df().to_csv(index=False)``. "pyarrow"
+                uses pyarrow's C++ writer, which is faster on large
+                statements but quotes every string and writes whole
+                amounts without a decimal (``100`` rather than ``100.0``).
+        """
+        if engine not in ("csv", "pyarrow"):
+            raise ValueError(f"Unknown CSV engine: {engine!r}")
         self.get_metadata_df().to_csv(metadata_path, index=False)
-        self.get_transactions_df().to_csv(transactions_path, index=False)
+        if engine == "pyarrow":
+            self._write_transactions_csv_arrow(transactions_path)
+        else:
+            self._write_transactions_csv(transactions_path)
+    
+    def _transaction_columns(self) -> List[Tuple[Any, ...]]:
+        """Transaction fields transposed into one tuple per column."""
+        # Build column-wise: one sequence per column instead of one dict per row
+        columns = list(zip(*map(_TRANSACTION_FIELDS, self.transactions)))
+        return columns or [()] * len(_TRANSACTION_HEADERS)
+    
+    def _write_transactions_csv(self, transactions_path: str) -> None:
+        """Stream transactions to CSV with the standard library writer."""
+        _write_transactions_csv(transactions_path, self.transactions)
+    
+    def _write_transactions_csv_arrow(self, transactions_path: str) -> None:
+        """Write transactions to CSV with pyarrow's C++ writer."""
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        
+        cols = self._transaction_columns()
+        types = [pa.string()] * 4 + [pa.float64()] * 3
+        table = pa.table({
+            name: pa.array(col, type=type_)
+            for name, col, type_ in zip(_TRANSACTION_HEADERS, cols, types)
+        })
+        write_options = pacsv.WriteOptions(include_header=True)
+        pacsv.write_csv(table, transactions_path, write_options=write_options)
 
 
 class BaseBankParser(ABC):
-    """Abstract base class for bank statement parsers."""
+    """
+    Abstract base class for bank statement parsers.
+    
+    Subclasses must set the ``bank_name`` class attribute to the name of the
+    bank they handle, so it can be read without creating an instance.
+    """
+    
+    bank_name: ClassVar[str] = ""
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check that parser classes declare a (non-empty) bank name."""
+        super().__init_subclass__(**kwargs)
+        if not isinstance(cls.bank_name, str) or not cls.bank_name:
+            raise TypeError(f"{cls.__name__} must set the bank_name class attribute")
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize the parser with optional configuration."""
+        """
+        Initialize the parser with optional configuration.
+        
+        Recognized config keys:
+            num_workers: Number of worker processes used for per-page
+                extraction by parsers that support it (default: 1, serial).
+                Pass None to use ``min(os.cpu_count(), 4)``.
+            page_range: 1-based page numbers to load, passed to
+                ``pdfplumber.open(pages=...)``. Layout analysis is skipped
+                entirely for the other pages (default: all pages).
+            laparams: pdfminer layout parameters passed to
+                ``pdfplumber.open(laparams=...)`` (default: None, which is
+                pdfplumber's faster default extraction).
+            backend: Word extraction backend for parsers that support it:
+                "pdfplumber" (default) or "pypdfium2", which reads glyphs
+                straight into arrays and is much faster. Falls back to
+                pdfplumber if pypdfium2 is not installed.
+        """
         self.config = config or {}
+        num_workers = self.config.get("num_workers", 1)
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, 4)
+        self.num_workers: int = max(1, int(num_workers))
     
     @abstractmethod
-    def parse(self, pdf_path: Union[str, Path]) -> ParseResult:
-        """Parse a bank statement PDF and return structured data."""
+    def parse(
+        self, pdf_path: Union[str, Path], pdf: Optional[Any] = None
+    ) -> ParseResult:
+        """
+        Parse a bank statement PDF and return structured data.
+        
+        If an already opened ``pdfplumber.PDF`` is passed as ``pdf`` it is
+        used instead of re-opening ``pdf_path``; the caller keeps ownership
+        and is responsible for closing it.
+        """
         pass
     
     @abstractmethod
-    def can_parse(self, pdf_path: Union[str, Path]) -> bool:
-        """Check if this parser can handle the given PDF."""
+    def can_parse(self, pdf_path: Union[str, Path], pdf: Optional[Any] = None) -> bool:
+        """
+        Check if this parser can handle the given PDF.
+        
+        Accepts an optional already opened ``pdfplumber.PDF`` like ``parse``.
+        """
         pass
     
-    @property
-    @abstractmethod
-    def bank_name(self) -> str:
-        """Return the name of the bank this parser handles."""
-        pass
+    def iter_transactions(
+        self, pdf_path: Union[str, Path], pdf: Optional[Any] = None
+    ) -> Iterator[Transaction]:
+        """
+        Yield the statement's transactions in order.
+        
+        The default runs ``parse`` and yields its transactions; parsers that
+        can work page by page override this so only one page is held in
+        memory at a time. Metadata and the summary are not read.
+        """
+        yield from self.parse(pdf_path, pdf).transactions
+    
+    def export_to_csv_streaming(
+        self,
+        pdf_path: Union[str, Path],
+        transactions_path: Union[str, Path],
+        pdf: Optional[Any] = None,
+    ) -> int:
+        """
+        Parse a PDF straight into a transactions CSV.
+        
+        Rows are written as ``iter_transactions`` yields them (same format as
+        ``ParseResult.export_to_csv``), so the full list of transactions is
+        never built.
+        
+        Args:
+            pdf_path: Path to the PDF file.
+            transactions_path: Path of the CSV file to write.
+            pdf: Optional already opened pdfplumber PDF for ``pdf_path``.
+            
+        Returns:
+            The number of transactions written.
+        """
+        transactions = self.iter_transactions(pdf_path, pdf)
+        return _write_transactions_csv(transactions_path, transactions)
     
     def _parse_amount(self, amount_str: str) -> float:
         """Parse amount string to float (handles Indonesian format)."""
-        if not amount_str or amount_str.strip() == "":
+        if not amount_str:
             return 0.0
         
-        # Remove thousand separators (commas) and keep decimal point
-        cleaned = amount_str.replace(",", "").strip()
+        # Remove thousand separators and keep decimal point
+        cleaned = amount_str.translate(_AMOUNT_TRANS).strip()
+        if not cleaned:
+            return 0.0
         
         try:
             return float(cleaned)
         except ValueError:
-            return 0.0
\ No newline at end of file
+            return 0.0
+    
+    def _parse_amount_column(self, values: Sequence[Optional[str]]) -> "np.ndarray":
+        """
+        Parse a whole column of amount strings to float64 in one vectorized pass.
+        
+        Equivalent to calling ``_parse_amount`` on each value: thousand
+        separators are removed, surrounding whitespace is stripped and empty
+        or invalid values become 0.0.
+        """
+        import pandas as pd
+        
+        series = pd.Series(list(values), dtype=object)
+        cleaned = series.str.translate(_AMOUNT_TRANS).str.strip()
+        amounts = pd.to_numeric(cleaned, errors="coerce").fillna(0.0)
+        return amounts.to_numpy(dtype="float64")
+
+
+class PagedParserMixin(ABC):
+    """
+    Mixin for parsers whose statement pages can be read independently.
+    
+    List it before ``BaseBankParser`` in the parser's bases and implement
+    ``_extract_transactions``; ``_extract_all_transactions`` then reads
+    every page, serially or across ``num_workers`` processes.
+    """
+    
+    # Set by BaseBankParser.__init__
+    config: Dict[str, Any]
+    num_workers: int
+    
+    @abstractmethod
+    def _extract_transactions(self, page: Any) -> List[Transaction]:
+        """Extract the transactions of a single pdfplumber page."""
+        pass
+    
+    def _extract_all_transactions(self, pdf_path: Path, pdf: Any) -> List[Transaction]:
+        """Extract transactions from every page, in parallel if configured."""
+        n_pages = len(pdf.pages)
+        if self.num_workers == 1 or n_pages == 1:
+            return list(self._iter_page_transactions(pdf, keep_last=True))
+        
+        # Pages are independent, so extract them in parallel. Each worker
+        # re-opens the PDF for its own page rather than pickling pages, and
+        # builds an instance of this parser's own class so subclass
+        # overrides apply there too.
+        page_numbers = [page.page_number for page in pdf.pages]
+        extract = partial(
+            _extract_page_transactions, type(self), str(pdf_path), config=self.config
+        )
+        max_workers = min(self.num_workers, n_pages)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(extract, page_numbers))
+        return _concat_page_transactions(results)
+    
+    def _iter_page_transactions(
+        self, pdf: Any, keep_last: bool = False
+    ) -> Iterator[Transaction]:
+        """
+        Yield each page's transactions, releasing pages once consumed.
+        
+        Args:
+            pdf: Opened pdfplumber PDF.
+            keep_last: Keep the last page's cached words and layout, for
+                callers that read it again afterwards (e.g. for a summary).
+        """
+        last_page = pdf.pages[-1] if pdf.pages else None
+        for page in pdf.pages:
+            yield from self._extract_transactions(page)
+            if not (keep_last and page is last_page):
+                _release_page(page)
+
+
+def _extract_page_transactions(
+    parser_class: Callable[[Optional[Dict[str, Any]]], PagedParserMixin],
+    pdf_path: str,
+    page_number: int,
+    config: Optional[Dict[str, Any]] = None,
+) -> List[Transaction]:
+    """Extract transactions from a single 1-based page (process pool worker)."""
+    parser = parser_class(config)
+    # Only load the requested page
+    with _open_pdf(pdf_path, config, pages=[page_number]) as pdf:
+        return parser._extract_transactions(pdf.pages[0])
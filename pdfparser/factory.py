@@ -2,22 +2,28 @@
 Parser factory for automatically detecting and parsing different bank statement formats.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Type, Union, Optional, Dict, Any
+from typing import ClassVar, Iterable, List, Type, Union, Optional, Dict, Any, Tuple
 
-from .base import BaseBankParser, ParseResult
+from .base import BaseBankParser, ParseResult, _open_pdf
 from .parser import BRIParser
 
 
 class ParserFactory:
     """Factory class for creating appropriate bank statement parsers."""
     
+    # Available parsers, tried in order
+    _PARSER_CLASSES: ClassVar[Tuple[Type[BaseBankParser], ...]] = (
+        BRIParser,
+        # Add more parsers here as they are implemented
+    )
+    
     def __init__(self) -> None:
         """Initialize the factory with available parsers."""
-        self._parsers: List[Type[BaseBankParser]] = [
-            BRIParser,
-            # Add more parsers here as they are implemented
-        ]
+        self._parsers: Tuple[Type[BaseBankParser], ...] = self._PARSER_CLASSES
     
     def get_parser(self, pdf_path: Union[str, Path], config: Optional[Dict[str, Any]] = None) -> BaseBankParser:
         """
@@ -34,18 +40,21 @@ class ParserFactory:
             ValueError: If no suitable parser is found
         """
         pdf_path = Path(pdf_path)
-        
-        for parser_class in self._parsers:
-            parser = parser_class(config)
-            if parser.can_parse(pdf_path):
-                return parser
-        
-        raise ValueError(f"No suitable parser found for PDF: {pdf_path}")
+        pdf = self._open_pdf(pdf_path, config)
+        try:
+            parser = self._select_parser(pdf_path, pdf, config)
+        finally:
+            if pdf is not None:
+                pdf.close()
+        return parser
     
     def parse(self, pdf_path: Union[str, Path], config: Optional[Dict[str, Any]] = None) -> ParseResult:
         """
         Parse a bank statement PDF using the appropriate parser.
         
+        The PDF is opened once and the same handle is shared between
+        detection and parsing.
+        
         Args:
             pdf_path: Path to the PDF file
             config: Optional configuration dictionary
@@ -53,8 +62,41 @@ class ParserFactory:
         Returns:
             ParseResult containing metadata and transactions
         """
-        parser = self.get_parser(pdf_path, config)
-        return parser.parse(pdf_path)
+        pdf_path = Path(pdf_path)
+        pdf = self._open_pdf(pdf_path, config)
+        try:
+            parser = self._select_parser(pdf_path, pdf, config)
+            return parser.parse(pdf_path, pdf=pdf)
+        finally:
+            if pdf is not None:
+                pdf.close()
+    
+    def _open_pdf(
+        self, pdf_path: Union[str, Path], config: Optional[Dict[str, Any]] = None
+    ) -> Optional[Any]:
+        """Open the PDF once for all parsers, or return None if it cannot be opened."""
+        try:
+            return _open_pdf(pdf_path, config)
+        except Exception:
+            # Let each parser handle (and report on) the unreadable file itself
+            return None
+    
+    def _select_parser(
+        self,
+        pdf_path: Path,
+        pdf: Optional[Any],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> BaseBankParser:
+        """Return the first parser whose can_parse accepts the (shared) PDF."""
+        for parser_class in self._parsers:
+            if config is None:
+                parser = _default_parser(parser_class)
+            else:
+                parser = parser_class(config)
+            if parser.can_parse(pdf_path, pdf=pdf):
+                return parser
+        
+        raise ValueError(f"No suitable parser found for PDF: {pdf_path}")
     
     def list_supported_banks(self) -> List[str]:
         """
@@ -63,12 +105,18 @@ class ParserFactory:
         Returns:
             List of bank names that can be parsed
         """
-        banks = []
-        for parser_class in self._parsers:
-            # Create a temporary instance to get the bank name
-            temp_parser = parser_class()
-            banks.append(temp_parser.bank_name)
-        return banks
+        return [parser_class.bank_name for parser_class in self._parsers]
+
+
+@lru_cache(maxsize=None)
+def _default_parser(parser_class: Type[BaseBankParser]) -> BaseBankParser:
+    """
+    Shared instance of a parser class with the default configuration.
+    
+    Parsers only hold their config after __init__, so one instance can be
+    reused for every call that does not pass a config.
+    """
+    return parser_class()
 
 
 # Global factory instance
@@ -93,6 +141,36 @@ def parse_pdf(pdf_path: Union[str, Path], config: Optional[Dict[str, Any]] = Non
     return _factory.parse(pdf_path, config)
 
 
+def parse_pdfs(
+    pdf_paths: Iterable[Union[str, Path]],
+    config: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+) -> List[ParseResult]:
+    """
+    Parse several bank statement PDFs concurrently using auto-detection.
+    
+    Files are parsed on a thread pool so that one file's disk I/O overlaps
+    with another's parsing. For CPU-bound batches (long multi-page
+    statements) a ``concurrent.futures.ProcessPoolExecutor`` mapping
+    ``parse_pdf`` over the paths scales better.
+    
+    Args:
+        pdf_paths: Paths to the PDF files.
+        config: Optional configuration dictionary, used for every file.
+        max_workers: Number of threads (default: ``min(32, cpu_count * 4)``).
+        
+    Returns:
+        One ParseResult per path, in the same order as ``pdf_paths``.
+        
+    Example:
+        results = parse_pdfs(["may.pdf", "june.pdf"])
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda path: _factory.parse(path, config), pdf_paths))
+
+
 def get_supported_banks() -> List[str]:
     """
     Get a list of supported bank names.
@@ -100,7 +178,13 @@ def get_supported_banks() -> List[str]:
     Returns:
         List of bank names that can be parsed
     """
-    return _factory.list_supported_banks()
+    return list(_supported_banks())
+
+
+@lru_cache(maxsize=1)
+def _supported_banks() -> Tuple[str, ...]:
+    """Cached, immutable list of the global factory's bank names."""
+    return tuple(_factory.list_supported_banks())
 
 
 # Legacy compatibility
@@ -3,15 +3,176 @@ BRI Bank statement parser implementation.
 """
 
 import re
+from bisect import bisect_right
+from collections import OrderedDict
+from contextlib import ExitStack
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from threading import Lock
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import (
+    TYPE_CHECKING, Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
+)
 
-import pdfplumber
+from ._backends import PageWords, get_page_words
+from .base import (
+    BaseBankParser,
+    PagedParserMixin,
+    StatementMetadata,
+    Transaction,
+    ParseResult,
+    _concat_page_transactions,
+    _file_signature,
+    _open_pdf,
+    _page_text,
+    _page_words,
+)
 
-from .base import BaseBankParser, StatementMetadata, Transaction, ParseResult
+if TYPE_CHECKING:
+    import numpy as np
 
 
-class BRIParser(BaseBankParser):
+# Header metadata fields (see _extract_metadata), combined into one pattern so
+# the header text is scanned once. Each alternative is a zero-width lookahead:
+# matches never consume text, so a field value can't swallow the label of
+# the next field (e.g. a redacted "No. Rekening : Unit Kerja : ...").
+_RE_METADATA = re.compile(
+    r'(?=(?P<date>Tanggal Laporan\s*:\s*(?P<date_value>\d{2}/\d{2}/\d{2})))'
+    r'|(?=(?P<period>Periode Transaksi\s*:\s*'
+    r'(?P<period_start>\d{2}/\d{2}/\d{2})\s*-\s*(?P<period_end>\d{2}/\d{2}/\d{2})))'
+    r'|(?=(?P<account>No\. Rekening\s*:\s*(?P<account_value>\S+)))'
+    r'|(?=(?P<product>Nama Produk\s*:\s*(?P<product_value>\S+)))'
+    r'|(?=(?P<currency>Valuta\s*:\s*(?P<currency_value>\w+)))'
+    r'|(?=(?P<unit>Unit Kerja\s*:\s*(?P<unit_value>.+?))(?:\n|Alamat))'
+)
+
+# BRI-specific indicators checked by can_parse; plain substrings (no word
+# boundaries), matched in a single pass over the page text
+_BRI_INDICATOR_RE = re.compile(
+    r'PT\. BANK RAKYAT INDONESIA|Britama|Unit Kerja|Tanggal Laporan|BRI'
+)
+
+# Summary section header, which ends the transaction table
+_SUMMARY_RE = re.compile(r'Saldo Awal|Opening Balance')
+# Closing balance spelled out in words ("... RUPIAH")
+_RUPIAH_RE = re.compile(r'RUPIAH')
+# A single amount in the summary values row, e.g. "1,000,000.00"
+_RE_AMOUNT = re.compile(r'^-?[\d,]+(?:\.\d+)?$')
+# Minimum horizontal gap (pt) between two cells of the summary header row
+_SUMMARY_CELL_GAP = 10
+
+# pdfplumber extract_words settings (its defaults, spelled out), built once
+_WORD_SETTINGS: Dict[str, Any] = {
+    'keep_blank_chars': False,
+    'x_tolerance': 3,
+    'y_tolerance': 3,
+}
+# The same, keeping the PDF's text flow order (BRIParser.USE_TEXT_FLOW)
+_TEXT_FLOW_WORD_SETTINGS: Dict[str, Any] = {**_WORD_SETTINGS, 'use_text_flow': True}
+
+# Reading order of words: top to bottom, then left to right
+_WORD_SORT_KEY = itemgetter('top', 'x0')
+
+# Word fields, for lazy passes that may stop early (_find_table_start_y)
+_WORD_TEXT = itemgetter('text')
+_WORD_X0 = itemgetter('x0')
+_WORD_TOP = itemgetter('top')
+
+# Transaction line starts: date (DD/MM/YY) or time only (H:MM or HH:MM),
+# told apart by match.lastgroup
+_LINE_START_RE = re.compile(r'(?P<date>\d{2}/\d{2}/\d{2})|(?P<time>\d{1,2}:\d{2}$)')
+
+
+def _in_reading_order(words: List[Dict[str, Any]]) -> bool:
+    """Check whether words are sorted by (top, x0), as pdfplumber returns them."""
+    keys = list(map(_WORD_SORT_KEY, words))
+    return all(a <= b for a, b in zip(keys, keys[1:]))
+
+
+def _parse_metadata_text(text: Optional[str]) -> StatementMetadata:
+    """Parse statement metadata from the first page header text."""
+    if not text:
+        return StatementMetadata()
+    
+    metadata = StatementMetadata()
+    
+    # Only the first occurrence of each field counts
+    seen = set()
+    for match in _RE_METADATA.finditer(text):
+        field_name = match.lastgroup
+        if field_name in seen:
+            continue
+        seen.add(field_name)
+        
+        if field_name == "date":
+            # Statement Date: Tanggal Laporan : 03/06/25
+            metadata.statement_date = match.group("date_value")
+        elif field_name == "period":
+            # Transaction Period: Periode Transaksi : 01/05/25 - 31/05/25
+            metadata.transaction_period_start = match.group("period_start")
+            metadata.transaction_period_end = match.group("period_end")
+        elif field_name == "account":
+            # Account Number: No. Rekening :
+            # Note: Account number might be redacted in the sample
+            val = match.group("account_value")
+            if val not in ["Unit", "Kerja"]:  # Skip if parsing error
+                metadata.account_number = val
+        elif field_name == "product":
+            # Product Name: Nama Produk : Britama-IDR
+            metadata.product_name = match.group("product_value")
+        elif field_name == "currency":
+            # Currency: Valuta : IDR
+            metadata.currency = match.group("currency_value")
+        elif field_name == "unit":
+            # Business Unit: Unit Kerja : KCP SUCI
+            metadata.business_unit = match.group("unit_value").strip()
+    
+    return metadata
+
+
+# Page-1 text of recently seen files, most recently used last. Keyed by
+# _page1_key, so a file that changes on disk (or is opened with different
+# laparams) is read again. Shared by can_parse and parse, and across threads.
+_PAGE1_TEXT_CACHE: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+_PAGE1_TEXT_CACHE_SIZE = 64
+_PAGE1_TEXT_LOCK = Lock()
+
+
+def _page1_key(
+    pdf_path: Union[str, Path], config: Dict[str, Any]
+) -> Optional[Tuple[Any, ...]]:
+    """Cache key for page 1 text, or None if the file can't be stat'ed."""
+    signature = _file_signature(pdf_path)
+    if signature is None:
+        return None
+    return signature + (repr(config.get("laparams")),)
+
+
+def _get_page1_text(key: Tuple[Any, ...]) -> Optional[str]:
+    """Look up cached page 1 text."""
+    with _PAGE1_TEXT_LOCK:
+        text = _PAGE1_TEXT_CACHE.get(key)
+        if text is not None:
+            _PAGE1_TEXT_CACHE.move_to_end(key)
+        return text
+
+
+def _put_page1_text(key: Tuple[Any, ...], text: str) -> None:
+    """Cache page 1 text, evicting the least recently used entry if full."""
+    with _PAGE1_TEXT_LOCK:
+        _PAGE1_TEXT_CACHE[key] = text
+        _PAGE1_TEXT_CACHE.move_to_end(key)
+        while len(_PAGE1_TEXT_CACHE) > _PAGE1_TEXT_CACHE_SIZE:
+            _PAGE1_TEXT_CACHE.popitem(last=False)
+
+
+# Header metadata parsed from page 1 text (see _first_page_metadata)
+_metadata_from_text = lru_cache(maxsize=64)(_parse_metadata_text)
+
+
+class BRIParser(PagedParserMixin, BaseBankParser):
     """
     Parser for BRI (Bank Rakyat Indonesia) bank statement PDFs.
     
@@ -21,44 +182,54 @@ class BRIParser(BaseBankParser):
         result.export_to_csv("metadata.csv", "transactions.csv")
     """
     
+    bank_name = "BRI"
+    
     # Column boundaries for transaction table (x coordinates)
     # Columns: Date | Description | Teller | Debit | Credit | Balance
     COLUMN_BOUNDARIES = [0, 105, 290, 360, 470, 570, 700]
     
+    # Inner column edges; bisect_right(_COLUMN_EDGES, x) is the column index
+    _COLUMN_EDGES = tuple(COLUMN_BOUNDARIES[1:-1])
+    
     # Y coordinate where transaction table starts (after header row)
     TABLE_START_Y = 340
     
-    @property
-    def bank_name(self) -> str:
-        """Return the name of the bank this parser handles."""
-        return "BRI"
+    # Extract words in the PDF's text flow order (pdfplumber use_text_flow)
+    # instead of sorting characters by position. Off by default since some
+    # PDFs draw text out of reading order; pages whose words don't come out
+    # sorted are still grouped correctly, via the sorting fallback.
+    USE_TEXT_FLOW = False
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive the column edges from a subclass's own COLUMN_BOUNDARIES."""
+        super().__init_subclass__(**kwargs)
+        cls._COLUMN_EDGES = tuple(cls.COLUMN_BOUNDARIES[1:-1])
+    
+    def can_parse(self, pdf_path: Union[str, Path], pdf: Optional[Any] = None) -> bool:
+        """
+        Check if this parser can handle the given PDF.
         
-    def can_parse(self, pdf_path: Union[str, Path]) -> bool:
-        """Check if this parser can handle the given PDF."""
+        Reads page 1 with pdfplumber rather than ``get_page_text``: ``parse``
+        takes the header metadata from the same cached text, so pypdfium2
+        would only add a second read of the page.
+        """
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                if not pdf.pages:
-                    return False
-                
-                text = pdf.pages[0].extract_text() or ""
-                # Look for BRI-specific indicators
-                bri_indicators = [
-                    "PT. BANK RAKYAT INDONESIA",
-                    "BRI",
-                    "Britama",
-                    "Unit Kerja",
-                    "Tanggal Laporan"
-                ]
-                return any(indicator in text for indicator in bri_indicators)
+            text = self._first_page_text(pdf_path, pdf)
         except Exception:
             return False
+        
+        # Look for BRI-specific indicators
+        return _BRI_INDICATOR_RE.search(text) is not None
     
-    def parse(self, pdf_path: Union[str, Path]) -> ParseResult:
+    def parse(
+        self, pdf_path: Union[str, Path], pdf: Optional[Any] = None
+    ) -> ParseResult:
         """
         Parse a BRI bank statement PDF.
         
         Args:
             pdf_path: Path to the PDF file.
+            pdf: Optional already opened pdfplumber PDF for ``pdf_path``.
             
         Returns:
             ParseResult containing metadata and transactions.
@@ -67,16 +238,16 @@ class BRIParser(BaseBankParser):
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
-        with pdfplumber.open(pdf_path) as pdf:
+        with ExitStack() as stack:
+            if pdf is None:
+                pdf = stack.enter_context(_open_pdf(pdf_path, self.config))
+            
             # Extract metadata from first page header
-            metadata = self._extract_metadata(pdf.pages[0])
+            metadata = self._first_page_metadata(pdf_path, pdf)
             metadata.bank_name = self.bank_name
             
             # Extract transactions from all pages
-            transactions = []
-            for page in pdf.pages:
-                page_transactions = self._extract_transactions(page)
-                transactions.extend(page_transactions)
+            transactions = self._extract_all_transactions(pdf_path, pdf)
             
             # Extract summary from last page
             summary = self._extract_summary(pdf.pages[-1])
@@ -87,62 +258,97 @@ class BRIParser(BaseBankParser):
             summary=summary
         )
     
-    def _extract_metadata(self, page: Any) -> StatementMetadata:
-        """Extract metadata from the first page header section."""
-        text = page.extract_text()
-        if not text:
-            return StatementMetadata()
-        
-        metadata = StatementMetadata()
-        
-        # Statement Date: Tanggal Laporan : 03/06/25
-        date_match = re.search(r'Tanggal Laporan\s*:\s*(\d{2}/\d{2}/\d{2})', text)
-        if date_match:
-            metadata.statement_date = date_match.group(1)
+    def _extract_all_transactions(self, pdf_path: Path, pdf: Any) -> List[Transaction]:
+        """Extract transactions from every page, in parallel if configured."""
+        if self.config.get("backend") == "pypdfium2":
+            page_indices = [page.page_number - 1 for page in pdf.pages]
+            page_words = get_page_words(pdf_path, page_indices)
+            if page_words is not None:
+                return _concat_page_transactions(
+                    [self._extract_page_words_transactions(w) for w in page_words]
+                )
+        
+        return super()._extract_all_transactions(pdf_path, pdf)
+    
+    def iter_transactions(
+        self, pdf_path: Union[str, Path], pdf: Optional[Any] = None
+    ) -> Iterator[Transaction]:
+        """
+        Yield transactions page by page, without building the full list.
         
-        # Transaction Period: Periode Transaksi : 01/05/25 - 31/05/25
-        period_match = re.search(
-            r'Periode Transaksi\s*:\s*(\d{2}/\d{2}/\d{2})\s*-\s*(\d{2}/\d{2}/\d{2})', 
-            text
-        )
-        if period_match:
-            metadata.transaction_period_start = period_match.group(1)
-            metadata.transaction_period_end = period_match.group(2)
-        
-        # Account Number: No. Rekening :
-        # Note: Account number might be redacted in the sample
-        account_match = re.search(r'No\. Rekening\s*:\s*(\S+)', text)
-        if account_match:
-            val = account_match.group(1)
-            if val not in ["Unit", "Kerja"]:  # Skip if parsing error
-                metadata.account_number = val
+        Each page's layout and words are released once its transactions have
+        been yielded, so memory use doesn't grow with the statement length.
+        Metadata and the summary are not read; use ``parse`` for those.
         
-        # Product Name: Nama Produk : Britama-IDR
-        product_match = re.search(r'Nama Produk\s*:\s*(\S+)', text)
-        if product_match:
-            metadata.product_name = product_match.group(1)
+        Pages are always read one at a time with pdfplumber: the
+        ``num_workers`` and ``backend`` config options only apply to
+        ``parse``.
         
-        # Currency: Valuta : IDR
-        currency_match = re.search(r'Valuta\s*:\s*(\w+)', text)
-        if currency_match:
-            metadata.currency = currency_match.group(1)
+        Args:
+            pdf_path: Path to the PDF file.
+            pdf: Optional already opened pdfplumber PDF for ``pdf_path``.
+            
+        Yields:
+            Transactions in statement order.
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
-        # Business Unit: Unit Kerja : KCP SUCI
-        unit_match = re.search(r'Unit Kerja\s*:\s*(.+?)(?:\n|Alamat)', text)
-        if unit_match:
-            metadata.business_unit = unit_match.group(1).strip()
+        with ExitStack() as stack:
+            if pdf is None:
+                pdf = stack.enter_context(_open_pdf(pdf_path, self.config))
+            yield from self._iter_page_transactions(pdf)
+    
+    def _first_page_text(self, pdf_path: Union[str, Path], pdf: Optional[Any]) -> str:
+        """
+        Page 1 text, memoized per file when it can be stat'ed.
         
-        return metadata
+        Taken from ``pdf`` when it has page 1 loaded, so an opened handle is
+        never opened a second time; otherwise only page 1 is loaded.
+        """
+        key = _page1_key(pdf_path, self.config)
+        if key is not None:
+            text = _get_page1_text(key)
+            if text is not None:
+                return text
+        
+        if pdf is not None and pdf.pages and pdf.pages[0].page_number == 1:
+            text = _page_text(pdf.pages[0])
+        else:
+            with _open_pdf(pdf_path, self.config, pages=[1]) as first:
+                text = _page_text(first.pages[0]) if first.pages else ""
+        
+        if key is not None:
+            _put_page1_text(key, text)
+        return text
+    
+    def _first_page_metadata(
+        self, pdf_path: Union[str, Path], pdf: Any
+    ) -> StatementMetadata:
+        """Metadata from the first page header, memoized per file when possible."""
+        page = pdf.pages[0]
+        if page.page_number != 1:
+            return self._extract_metadata(page)
+        text = self._first_page_text(pdf_path, pdf)
+        # Return a copy, as the caller fills in fields such as bank_name
+        return replace(_metadata_from_text(text))
+    
+    def _extract_metadata(self, page: Any) -> StatementMetadata:
+        """Extract metadata from the first page header section."""
+        return _parse_metadata_text(_page_text(page))
     
     def _extract_transactions(self, page: Any) -> List[Transaction]:
         """Extract transactions from a page using word-level parsing."""
-        words = page.extract_words()
+        words = self._get_words(page)
         if not words:
             return []
         
         # Dynamically find the transaction table start position
         # Look for the header row containing "Tanggal" followed by transaction data
-        table_start_y = self._find_table_start_y(words)
+        table_start_y = self._find_table_start_y(
+            map(_WORD_TEXT, words), map(_WORD_X0, words), map(_WORD_TOP, words)
+        )
         
         # Filter words that are below the header (in the transaction area)
         transaction_words = [w for w in words if w['top'] > table_start_y]
@@ -150,21 +356,60 @@ class BRIParser(BaseBankParser):
         if not transaction_words:
             return []
         
-        # Group words by their y position (same line)
-        lines = self._group_words_by_line(transaction_words)
+        # Group words by their y position (same line), streamed straight
+        # into the transaction parser
+        lines = self._iter_lines(transaction_words)
         
         # Parse lines into transactions
         transactions = self._parse_transaction_lines(lines)
         
         return transactions
     
-    def _find_table_start_y(self, words: List[Dict[str, Any]]) -> float:
-        """Find the Y position where the transaction table starts."""
+    def _get_words(self, page: Any) -> List[Dict[str, Any]]:
+        """Memoized ``extract_words`` with this parser's word settings."""
+        settings = _TEXT_FLOW_WORD_SETTINGS if self.USE_TEXT_FLOW else _WORD_SETTINGS
+        return _page_words(page, settings)
+    
+    def _extract_page_words_transactions(self, words: PageWords) -> List[Transaction]:
+        """Extract transactions from a page's word arrays (pypdfium2 backend)."""
+        import numpy as np
+        
+        if not words.text:
+            return []
+        
+        table_start_y = self._find_table_start_y(words.text, words.x0, words.top)
+        
+        # Keep the transaction area, group it into lines, and only then build
+        # the small per-word dicts _parse_transaction_lines reads
+        area = np.flatnonzero(words.top > table_start_y)
+        if not len(area):
+            return []
+        x0s = words.x0[area]
+        tops = words.top[area]
+        area_words = [
+            {'text': words.text[i], 'x0': x0, 'top': top}
+            for i, x0, top in zip(area.tolist(), x0s.tolist(), tops.tolist())
+        ]
+        lines = [
+            [area_words[i] for i in line.tolist()]
+            for line in self._line_indices(x0s, tops)
+        ]
+        return self._parse_transaction_lines(lines)
+    
+    def _find_table_start_y(
+        self, texts: Iterable[str], x0s: Iterable[float], tops: Iterable[float]
+    ) -> float:
+        """
+        Find the Y position where the transaction table starts.
+        
+        Takes the page's words as parallel text, x0 and top iterables, so the
+        pdfplumber word dicts and the pypdfium2 word arrays share this search.
+        """
         # Find the header row (contains "Tanggal" at x < 100)
         header_y = None
-        for word in words:
-            if word['text'] == 'Tanggal' and float(word['x0']) < 100:
-                header_y = word['top']
+        for text, x0, top in zip(texts, x0s, tops):
+            if text == 'Tanggal' and float(x0) < 100:
+                header_y = top
                 break
         
         if header_y is not None:
@@ -175,37 +420,93 @@ class BRIParser(BaseBankParser):
         # Fallback to default if header not found
         return float(self.TABLE_START_Y)
     
+    def _iter_lines(
+        self, words: List[Dict[str, Any]]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the lines of ``_group_words_by_line`` in a single pass.
+        
+        pdfplumber normally returns words already sorted by (top, x0), in
+        which case each line is cut off as the words stream by, with no sort
+        and no list of lines. Otherwise this falls back to
+        ``_group_words_by_line``.
+        """
+        if not _in_reading_order(words):
+            yield from self._group_words_by_line(words)
+            return
+        
+        # Same rule as _group_words_by_line: a line takes every word less
+        # than 5pt below its first word
+        line: List[Dict[str, Any]] = []
+        line_top = 0.0
+        for word in words:
+            if line and word['top'] < line_top + 5:
+                line.append(word)
+            else:
+                if line:
+                    yield line
+                line = [word]
+                line_top = word['top']
+        if line:
+            yield line
+    
     def _group_words_by_line(self, words: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
         """Group words into lines based on their y position."""
         if not words:
             return []
         
+        import numpy as np
+        
+        n = len(words)
+        tops = np.fromiter((w['top'] for w in words), dtype=np.float64, count=n)
+        x0s = np.fromiter((w['x0'] for w in words), dtype=np.float64, count=n)
+        lines = self._line_indices(x0s, tops)
+        return [[words[i] for i in line.tolist()] for line in lines]
+    
+    def _line_indices(
+        self, x0s: "np.ndarray", tops: "np.ndarray"
+    ) -> List["np.ndarray"]:
+        """
+        Group word positions into lines.
+        
+        Args:
+            x0s: Left edge of each word.
+            tops: Top edge of each word.
+            
+        Returns:
+            Word indices of each line, top to bottom, left to right in a line.
+        """
+        import numpy as np
+        
+        n = len(tops)
+        
         # Sort by y position then x position
-        sorted_words = sorted(words, key=lambda w: (w['top'], w['x0']))
+        order = np.lexsort((x0s, tops))
+        sorted_tops = tops[order]
         
+        # A line starts at its first word and takes every following word less
+        # than 5pt (the tolerance) below it, so each line's end is found with
+        # a binary search instead of a comparison per word
         lines = []
-        current_line = [sorted_words[0]]
-        current_y: float = float(sorted_words[0]['top'])
-        
-        for word in sorted_words[1:]:
-            # If word is on same line (within tolerance)
-            word_y = float(word['top'])
-            if abs(word_y - current_y) < 5:
-                current_line.append(word)
-            else:
-                lines.append(current_line)
-                current_line = [word]
-                current_y = word_y
-        
-        if current_line:
-            lines.append(current_line)
+        start = 0
+        while start < n:
+            end = int(np.searchsorted(sorted_tops, sorted_tops[start] + 5, side='left'))
+            lines.append(order[start:end])
+            start = end
         
         return lines
     
-    def _parse_transaction_lines(self, lines: List[List[Dict[str, Any]]]) -> List[Transaction]:
+    def _parse_transaction_lines(
+        self, lines: Iterable[List[Dict[str, Any]]]
+    ) -> List[Transaction]:
         """Parse grouped lines into Transaction objects."""
-        transactions = []
+        # Every transaction started on the page, valid or not, and its raw
+        # (debit, credit, balance) strings; amounts are parsed in one batch
+        candidates: List[Transaction] = []
+        amount_texts: List[Tuple[str, str, str]] = []
         current_transaction: Optional[Transaction] = None
+        # Description pieces of current_transaction, joined once it's finished
+        desc_parts: List[str] = []
         stop_processing = False
         last_date: Optional[str] = None
         
@@ -213,47 +514,63 @@ class BRIParser(BaseBankParser):
             if stop_processing:
                 break
                 
-            # Check if we've reached the summary section
-            line_text = " ".join(w['text'] for w in line_words)
-            if "Saldo Awal" in line_text or "Opening Balance" in line_text:
-                stop_processing = True
-                continue
+            # Check if we've reached the summary section. A match always has
+            # "Saldo" or "Opening" inside one word, so the joined text is only
+            # built for lines that have such a word.
+            if any('Saldo' in w['text'] or 'Opening' in w['text'] for w in line_words):
+                line_text = " ".join(w['text'] for w in line_words)
+                if _SUMMARY_RE.search(line_text):
+                    stop_processing = True
+                    continue
             
             # Check if this line starts a new transaction (has date/time pattern)
             first_word = line_words[0]['text'] if line_words else ''
             
-            # Date pattern: DD/MM/YY
-            is_new_transaction = bool(re.match(r'\d{2}/\d{2}/\d{2}', first_word))
+            # "date": DD/MM/YY. "time": time only (H:MM or HH:MM), which
+            # indicates a transaction with missing date (edge case in some
+            # statements)
+            match = _LINE_START_RE.match(first_word)
+            kind = match.lastgroup if match else None
             
-            # Also check for time-only pattern (H:MM or HH:MM) which indicates a
-            # transaction with missing date (edge case in some statements)
-            is_time_only_transaction = bool(re.match(r'^\d{1,2}:\d{2}$', first_word))
-            
-            if is_new_transaction or is_time_only_transaction:
-                # Save previous transaction if exists and is valid
-                if current_transaction is not None and self._is_valid_transaction(current_transaction):
-                    transactions.append(current_transaction)
+            if kind is not None:
+                # Finish previous transaction
+                if current_transaction is not None:
+                    current_transaction.description = " ".join(desc_parts)
                 
                 # Start new transaction
-                current_transaction = self._parse_transaction_line(line_words)
+                current_transaction, amounts = self._split_transaction_line(line_words)
+                candidates.append(current_transaction)
+                amount_texts.append(amounts)
+                desc_parts = [current_transaction.description]
                 
                 # For time-only transactions, use the last known date
-                if is_time_only_transaction and last_date is not None:
+                if kind == "time" and last_date is not None:
                     current_transaction.transaction_date = last_date
                     current_transaction.transaction_time = first_word
-                elif is_new_transaction:
+                elif kind == "date":
                     last_date = current_transaction.transaction_date
             elif current_transaction is not None:
                 # This is a continuation line - append to description
                 continuation_text = self._get_description_from_line(line_words)
                 if continuation_text:
-                    current_transaction.description += " " + continuation_text
+                    desc_parts.append(continuation_text)
         
         # Don't forget the last transaction
-        if current_transaction is not None and self._is_valid_transaction(current_transaction):
-            transactions.append(current_transaction)
+        if current_transaction is not None:
+            current_transaction.description = " ".join(desc_parts)
         
-        return transactions
+        if not candidates:
+            return []
+        
+        # Parse all of the page's amounts in one batch, then drop invalid rows
+        values = self._parse_amount_column(list(chain.from_iterable(amount_texts)))
+        rows = values.reshape(-1, 3).tolist()
+        for transaction, (debit, credit, balance) in zip(candidates, rows):
+            transaction.debit = debit
+            transaction.credit = credit
+            transaction.balance = balance
+        
+        return [t for t in candidates if self._is_valid_transaction(t)]
     
     def _is_valid_transaction(self, transaction: Transaction) -> bool:
         """Check if a transaction is valid (not empty)."""
@@ -265,47 +582,33 @@ class BRIParser(BaseBankParser):
             return False
         return True
     
-    def _parse_transaction_line(self, words: List[Dict[str, Any]]) -> Transaction:
-        """Parse a single transaction line from words."""
+    def _split_transaction_line(
+        self, words: List[Dict[str, Any]]
+    ) -> Tuple[Transaction, Tuple[str, str, str]]:
+        """
+        Split a transaction line into its columns.
+        
+        Args:
+            words: Words of the line, in reading order.
+            
+        Returns:
+            A Transaction with zero amounts, and the raw debit, credit and
+            balance text for batch parsing.
+        """
         # Initialize with defaults
         date = ""
         time: Optional[str] = None
         description = ""
         teller = ""
-        debit = 0.0
-        credit = 0.0
-        balance = 0.0
-        
-        # Column boundaries
-        date_end = 105
-        desc_end = 290
-        teller_end = 360
-        debit_end = 470
-        credit_end = 570
-        
-        date_words = []
-        desc_words = []
-        teller_words = []
-        debit_words = []
-        credit_words = []
-        balance_words = []
         
+        # Bucket each word into its column:
+        # Date | Description | Teller | Debit | Credit | Balance
+        columns: List[List[str]] = [[] for _ in range(len(self._COLUMN_EDGES) + 1)]
         for word in words:
-            x = float(word['x0'])
-            text = word['text']
-            
-            if x < date_end:
-                date_words.append(text)
-            elif x < desc_end:
-                desc_words.append(text)
-            elif x < teller_end:
-                teller_words.append(text)
-            elif x < debit_end:
-                debit_words.append(text)
-            elif x < credit_end:
-                credit_words.append(text)
-            else:
-                balance_words.append(text)
+            column = bisect_right(self._COLUMN_EDGES, float(word['x0']))
+            columns[column].append(word['text'])
+        (date_words, desc_words, teller_words,
+         debit_words, credit_words, balance_words) = columns
         
         # Parse date and time (format: DD/MM/YY HH:MM:SS)
         if date_words:
@@ -322,20 +625,19 @@ class BRIParser(BaseBankParser):
         # Teller/User ID
         teller = " ".join(teller_words)
         
-        # Parse amounts
-        debit = self._parse_amount(" ".join(debit_words))
-        credit = self._parse_amount(" ".join(credit_words))
-        balance = self._parse_amount(" ".join(balance_words))
-        
-        return Transaction(
+        transaction = Transaction(
             transaction_date=date,
             transaction_time=time,
             description=description,
             teller_user_id=teller,
-            debit=debit,
-            credit=credit,
-            balance=balance
+            debit=0.0,
+            credit=0.0,
+            balance=0.0
+        )
+        amounts = (
+            " ".join(debit_words), " ".join(credit_words), " ".join(balance_words)
         )
+        return transaction, amounts
     
     def _get_description_from_line(self, words: List[Dict[str, Any]]) -> str:
         """Extract description text from a continuation line."""
@@ -347,46 +649,78 @@ class BRIParser(BaseBankParser):
                 desc_words.append(word['text'])
         return " ".join(desc_words)
     
-
-    
     def _extract_summary(self, page: Any) -> Dict[str, Any]:
         """Extract summary information from the last page."""
         summary: Dict[str, Any] = {}
         
-        # Try table extraction first (more reliable)
-        tables = page.extract_tables()
-        for table in tables:
-            for row in table:
-                if not row:
-                    continue
-                row_text = str(row[0]) if row[0] else ""
-                
-                # Opening Balance row
-                if "Saldo Awal" in row_text or "Opening Balance" in row_text:
-                    # Next row should have the values
+        # Read the summary table from the page's words (already extracted for
+        # the transactions) rather than running pdfplumber's table finder
+        header: Optional[List[Dict[str, Any]]] = None
+        for line_words in self._iter_lines(self._get_words(page)):
+            line_text = " ".join(w['text'] for w in line_words)
+            
+            # Opening Balance header rows
+            if _SUMMARY_RE.search(line_text):
+                # Next row should have the values
+                header = line_words
+                continue
+            if header is None:
+                continue
+            
+            # Summary values row (4 numeric columns)
+            if "Opening Balance" not in summary:
+                values = self._summary_values(header, line_words)
+                if len(values) >= 4 and values[0] > 0:
+                    summary["Opening Balance"] = values[0]
+                    summary["Total Debit"] = values[1]
+                    summary["Total Credit"] = values[2]
+                    summary["Closing Balance"] = values[3]
                     continue
-                    
-                # Summary values row (4 numeric columns)
-                if len(row) >= 4:
-                    try:
-                        # Check if this looks like a values row
-                        first_val = self._parse_amount(str(row[0]))
-                        if first_val > 0:
-                            summary["Opening Balance"] = first_val
-                            if row[1]:
-                                summary["Total Debit"] = self._parse_amount(str(row[1]))
-                            if row[2]:
-                                summary["Total Credit"] = self._parse_amount(str(row[2]))
-                            if row[3]:
-                                summary["Closing Balance"] = self._parse_amount(str(row[3]))
-                    except (ValueError, IndexError):
-                        pass
-                
-                # Balance in words
-                if "RUPIAH" in row_text:
-                    summary["Balance In Words"] = row_text.strip()
+            
+            # Balance in words
+            if _RUPIAH_RE.search(line_text):
+                summary["Balance In Words"] = line_text.strip()
         
         return summary
+    
+    def _summary_values(
+        self, header: List[Dict[str, Any]], line_words: List[Dict[str, Any]]
+    ) -> List[float]:
+        """
+        Read a summary values row against its header row.
+        
+        Args:
+            header: Words of the last summary header row.
+            line_words: Words of the candidate values row.
+            
+        Returns:
+            One amount per header cell, or an empty list if the row isn't
+            made of amounts.
+        """
+        amounts = [self._parse_amount(w['text']) for w in line_words]
+        if not amounts or not all(_RE_AMOUNT.match(w['text']) for w in line_words):
+            return []
+        
+        # Header cells are runs of words separated by wide gaps; each amount
+        # belongs to the cell whose center is nearest its own
+        centers: List[float] = []
+        cell_x0 = cell_x1 = float(header[0]['x0'])
+        for word in header:
+            x0, x1 = float(word['x0']), float(word.get('x1', word['x0']))
+            if x0 - cell_x1 > _SUMMARY_CELL_GAP:
+                centers.append((cell_x0 + cell_x1) / 2)
+                cell_x0 = x0
+            cell_x1 = max(cell_x1, x1)
+        centers.append((cell_x0 + cell_x1) / 2)
+        if len(centers) < len(amounts):
+            return amounts
+        
+        values = [0.0] * len(centers)
+        for word, amount in zip(line_words, amounts):
+            center = (float(word['x0']) + float(word.get('x1', word['x0']))) / 2
+            cell = min(range(len(centers)), key=lambda i: abs(centers[i] - center))
+            values[cell] = amount
+        return values
 
 
 def parse_pdf(pdf_path: Union[str, Path], config: Optional[Dict[str, Any]] = None) -> ParseResult:
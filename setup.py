@@ -43,6 +43,10 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "fast": [
+            "pypdfium2>=4.0",
+            "pyarrow>=8.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from typing import List, Sequence, Tuple
 
 # Test data directory
 TEST_DATA_DIR = Path(__file__).parent / "data"
@@ -21,4 +22,67 @@ def expected_metadata():
         "Product Name": "Britama-IDR",
         "Currency": "IDR",
         "Bank Name": "BRI"
-    }
\ No newline at end of file
+    }
+
+
+def write_pdf(path: Path, pages: Sequence[Sequence[Tuple[float, float, str]]]) -> Path:
+    """
+    Write a minimal PDF with Helvetica text placed at (x0, top, text).
+    
+    ``top`` is measured from the top of the page, like pdfplumber's.
+    """
+    width, height, size = 720, 842, 8
+    font = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    # Objects 1 and 2 (catalog, page tree) are filled in once pages exist
+    objects: List[bytes] = [b"", b"", font]
+    page_ids = []
+    for words in pages:
+        ops = []
+        for x0, top, text in words:
+            escaped = text.replace("\\", "\\\\").replace("(", "\\(")
+            escaped = escaped.replace(")", "\\)")
+            y = height - top - size
+            ops.append(f"BT /F1 {size} Tf {x0} {y} Td ({escaped}) Tj ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (width, height, len(objects))
+        )
+        page_ids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    kids = b" ".join(b"%d 0 R" % i for i in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+    
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref
+    path.write_bytes(bytes(out))
+    return path
+
+
+@pytest.fixture
+def bri_pdf(tmp_path):
+    """A small two-page BRI-style statement written to disk."""
+    header = [
+        (20, 40, "PT. BANK RAKYAT INDONESIA (PERSERO) Tbk."),
+        (20, 60, "Tanggal Laporan : 03/06/25"),
+        (20, 300, "Tanggal Transaksi"),
+    ]
+    rows = [
+        [(20, 330, "01/05/25"), (110, 330, "TRANSFER"),
+         (480, 330, "1,000.00"), (580, 330, "5,000.00")],
+        [(20, 330, "02/05/25"), (110, 330, "TARIK"),
+         (380, 330, "500.00"), (580, 330, "4,500.00")],
+    ]
+    return write_pdf(tmp_path / "bri.pdf", [header + rows[0], header + rows[1]])
@@ -1,11 +1,30 @@
 """Tests for BRI parser functionality."""
 
+import pickle
+import sys
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from pdfparser import BRIParser, parse_pdf, get_supported_banks
-from pdfparser.base import StatementMetadata, Transaction, ParseResult
+from pdfparser import (
+    BRIParser, ParserFactory, parse_pdf, parse_pdfs, get_supported_banks
+)
+from pdfparser.base import (
+    BaseBankParser, PagedParserMixin, StatementMetadata, Transaction, ParseResult
+)
+
+
+class NoTableBRIParser(BRIParser):
+    """BRI parser variant whose table never starts (module level so it pickles)."""
+    
+    def _find_table_start_y(self, *args, **kwargs):
+        return float("inf")
+
+
+class NarrowDateBRIParser(BRIParser):
+    """BRI parser variant with a narrower date column."""
+    
+    COLUMN_BOUNDARIES = [0, 50, 290, 360, 470, 570, 700]
 
 
 class TestBRIParser:
@@ -22,6 +41,7 @@ class TestBRIParser:
         assert parser._parse_amount("1,234.56") == 1234.56
         assert parser._parse_amount("1234") == 1234.0
         assert parser._parse_amount("0.00") == 0.0
+        assert parser._parse_amount("1\xa0234.50") == 1234.5
     
     def test_parse_amount_invalid(self):
         """Test amount parsing with invalid inputs."""
@@ -30,6 +50,176 @@ class TestBRIParser:
         assert parser._parse_amount("invalid") == 0.0
         assert parser._parse_amount(None) == 0.0
     
+    def test_parse_amount_column_matches_scalar(self):
+        """Test vectorized amount parsing agrees with _parse_amount."""
+        parser = BRIParser()
+        values = [
+            "1,234.56", "1234", "", "  ", "invalid", None, " 7,000.00 ", "1,000 500"
+        ]
+        expected = [parser._parse_amount(v) for v in values]
+        assert parser._parse_amount_column(values).tolist() == expected
+        # Two words in one amount column mustn't merge into one number
+        assert expected[-1] == 0.0
+    
+    def test_extract_metadata(self, expected_metadata):
+        """Test header metadata extraction, including a redacted account number."""
+        page = Mock()
+        page.extract_text.return_value = (
+            "Tanggal Laporan : 03/06/25\n"
+            "No. Rekening : Unit Kerja : KCP SUCI\n"
+            "Nama Produk : Britama-IDR Alamat Unit Kerja : JL SUCI\n"
+            "Valuta : IDR\n"
+            "Periode Transaksi : 01/05/25 - 31/05/25\n"
+        )
+        metadata = BRIParser()._extract_metadata(page).to_dict()
+        
+        for key, value in expected_metadata.items():
+            if key != "Bank Name":
+                assert metadata[key] == value
+        assert metadata["Account Number"] is None
+        assert metadata["Business Unit"] == "KCP SUCI"
+    
+    def test_group_words_by_line(self):
+        """Test that words within 5pt of a line's first word share the line."""
+        words = [
+            {'text': 'b', 'x0': 50.0, 'top': 3.0},
+            {'text': 'c', 'x0': 10.0, 'top': 6.0},
+            {'text': 'a', 'x0': 10.0, 'top': 0.0},
+            {'text': 'd', 'x0': 20.0, 'top': 20.0},
+        ]
+        lines = BRIParser()._group_words_by_line(words)
+        texts = [[w['text'] for w in line] for line in lines]
+        assert texts == [['a', 'b'], ['c'], ['d']]
+    
+    def test_iter_lines_matches_group_words_by_line(self):
+        """Test that the streaming pass groups like the sorting fallback."""
+        words = [
+            {'text': 'a', 'x0': 10.0, 'top': 0.0},
+            {'text': 'b', 'x0': 50.0, 'top': 3.0},
+            {'text': 'c', 'x0': 10.0, 'top': 6.0},
+            {'text': 'd', 'x0': 20.0, 'top': 20.0},
+        ]
+        parser = BRIParser()
+        assert list(parser._iter_lines(words)) == parser._group_words_by_line(words)
+        # Out of reading order falls back to sorting
+        shuffled = words[::-1]
+        expected = parser._group_words_by_line(shuffled)
+        assert list(parser._iter_lines(shuffled)) == expected
+    
+    def test_parse_transaction_lines_joins_continuations(self):
+        """Test that continuation lines extend the transaction description."""
+        lines = [
+            [{'text': '01/05/25', 'x0': 10.0}, {'text': 'TRANSFER', 'x0': 110.0},
+             {'text': '1,000.00', 'x0': 480.0}, {'text': '5,000.00', 'x0': 580.0}],
+            [{'text': 'FROM', 'x0': 110.0}, {'text': 'ACME', 'x0': 150.0}],
+            [{'text': 'REF123', 'x0': 110.0}],
+            [{'text': 'Saldo', 'x0': 10.0}, {'text': 'Awal', 'x0': 40.0}],
+            [{'text': 'IGNORED', 'x0': 110.0}],
+        ]
+        transactions = BRIParser()._parse_transaction_lines(lines)
+        assert len(transactions) == 1
+        assert transactions[0].description == "TRANSFER FROM ACME REF123"
+        assert transactions[0].credit == 1000.0
+        assert transactions[0].balance == 5000.0
+    
+    def test_parse_real_file_opens_pdf_once(self, bri_pdf):
+        """Test that detection and parsing share one pdfplumber handle."""
+        import pdfplumber
+        from pdfparser.parser import _PAGE1_TEXT_CACHE
+        _PAGE1_TEXT_CACHE.clear()
+        
+        with patch('pdfplumber.open', wraps=pdfplumber.open) as mock_open:
+            result = parse_pdf(bri_pdf)
+        assert mock_open.call_count == 1
+        assert result.metadata.statement_date == "03/06/25"
+        assert [t.balance for t in result.transactions] == [5000.0, 4500.0]
+        
+        # The cached page 1 text is reused by later calls on the same file
+        with patch('pdfplumber.open', wraps=pdfplumber.open) as mock_open:
+            assert BRIParser().can_parse(bri_pdf) is True
+        mock_open.assert_not_called()
+    
+    def test_subclass_column_boundaries(self):
+        """Test that a subclass's COLUMN_BOUNDARIES decide the columns."""
+        assert NarrowDateBRIParser._COLUMN_EDGES == (50, 290, 360, 470, 570)
+        assert BRIParser._COLUMN_EDGES == (105, 290, 360, 470, 570)
+        
+        line = [{'text': '01/05/25', 'x0': 20.0}, {'text': 'TRANSFER', 'x0': 60.0}]
+        transaction, _ = BRIParser()._split_transaction_line(line)
+        assert transaction.description == ""
+        transaction, _ = NarrowDateBRIParser()._split_transaction_line(line)
+        assert transaction.transaction_date == "01/05/25"
+        assert transaction.description == "TRANSFER"
+    
+    def test_worker_processes_use_parser_subclass(self, bri_pdf):
+        """Test that num_workers > 1 keeps a subclass's overrides."""
+        assert len(BRIParser({"num_workers": 2}).parse(bri_pdf).transactions) == 2
+        
+        serial = NoTableBRIParser().parse(bri_pdf).transactions
+        parallel = NoTableBRIParser({"num_workers": 2}).parse(bri_pdf).transactions
+        assert serial == parallel == []
+    
+    def test_extract_summary_from_words(self):
+        """Test that the summary table is read from the page's words."""
+        def word(text, x0, top):
+            return {'text': text, 'x0': x0, 'x1': x0 + 6 * len(text), 'top': top}
+        
+        page = Mock()
+        page.extract_words.return_value = [
+            word('Opening', 23.0, 600.0), word('Balance', 70.0, 600.0),
+            word('Total', 183.0, 600.0), word('Debit', 216.0, 600.0),
+            word('Total', 343.0, 600.0), word('Credit', 376.0, 600.0),
+            word('Closing', 503.0, 600.0), word('Balance', 550.0, 600.0),
+            # Total Debit left blank
+            word('1,000,000.00', 23.0, 615.0),
+            word('500,000.00', 343.0, 615.0), word('1,500,000.00', 503.0, 615.0),
+            word('SATU', 23.0, 640.0), word('JUTA', 53.0, 640.0),
+            word('RUPIAH', 83.0, 640.0),
+        ]
+        
+        summary = BRIParser()._extract_summary(page)
+        assert summary == {
+            "Opening Balance": 1000000.0,
+            "Total Debit": 0.0,
+            "Total Credit": 500000.0,
+            "Closing Balance": 1500000.0,
+            "Balance In Words": "SATU JUTA RUPIAH",
+        }
+        page.extract_tables.assert_not_called()
+    
+    def test_export_to_csv_streaming(self, tmp_path):
+        """Test that transactions stream to CSV page by page."""
+        def page(date):
+            mock_page = Mock()
+            mock_page.extract_words.return_value = [
+                {'text': date, 'x0': 20.0, 'top': 400.0},
+                {'text': '5,000.00', 'x0': 580.0, 'top': 400.0},
+            ]
+            return mock_page
+        
+        pages = [page('01/05/25'), page('02/05/25')]
+        pdf_path = tmp_path / "statement.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        csv_path = tmp_path / "transactions.csv"
+        
+        with patch('pdfparser.parser._open_pdf') as mock_open_pdf:
+            mock_open_pdf.return_value.__enter__.return_value = Mock(pages=pages)
+            assert BRIParser().export_to_csv_streaming(pdf_path, csv_path) == 2
+        
+        lines = csv_path.read_text(encoding="utf-8").splitlines()
+        assert lines[0].startswith("Transaction Date,")
+        assert [line.split(",")[0] for line in lines[1:]] == ["01/05/25", "02/05/25"]
+        # No summary is read, so every page is released once consumed
+        pages[0].close.assert_called_once()
+        pages[1].close.assert_called_once()
+    
+    def test_export_to_csv_streaming_missing_pdf(self, tmp_path):
+        """Test that a missing PDF doesn't leave a header-only CSV behind."""
+        csv_path = tmp_path / "transactions.csv"
+        with pytest.raises(FileNotFoundError):
+            BRIParser().export_to_csv_streaming(tmp_path / "missing.pdf", csv_path)
+        assert not csv_path.exists()
+    
     @patch('pdfplumber.open')
     def test_can_parse_bri_pdf(self, mock_open):
         """Test that parser can identify BRI PDFs."""
@@ -53,6 +243,147 @@ class TestBRIParser:
         
         parser = BRIParser()
         assert parser.can_parse("dummy.pdf") is False
+    
+    @patch('pdfplumber.open')
+    def test_can_parse_caches_first_page_text(self, mock_open, tmp_path):
+        """Test that page 1 is read once per unchanged file."""
+        from pdfparser.parser import _PAGE1_TEXT_CACHE
+        _PAGE1_TEXT_CACHE.clear()
+        
+        mock_pdf = Mock()
+        mock_page = Mock()
+        mock_page.extract_text.return_value = "PT. BANK RAKYAT INDONESIA"
+        mock_pdf.pages = [mock_page]
+        mock_open.return_value.__enter__.return_value = mock_pdf
+        pdf_path = tmp_path / "statement.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        
+        parser = BRIParser()
+        assert parser.can_parse(pdf_path) is True
+        assert parser.can_parse(str(pdf_path)) is True
+        assert mock_open.call_count == 1
+        
+        # A changed file is read again
+        pdf_path.write_bytes(b"%PDF-1.4\n%changed")
+        assert parser.can_parse(pdf_path) is True
+        assert mock_open.call_count == 2
+
+
+class TestMandiriExample:
+    """Test cases for the example Mandiri parser."""
+    
+    def test_metadata_fields_do_not_consume_each_other(self, monkeypatch):
+        """Test that a redacted field value doesn't swallow the next label."""
+        monkeypatch.syspath_prepend(str(Path(__file__).parent.parent / "examples"))
+        from mandiri_parser_example import MandiriParser
+        
+        text = "No. Rekening : Tanggal Cetak : 03/06/2025"
+        metadata = MandiriParser()._extract_metadata(text)
+        assert metadata.statement_date == "03/06/2025"
+    
+    def test_transactions_from_columns_round_trip(self, monkeypatch):
+        """Test that column-wise construction inverts the column view."""
+        monkeypatch.syspath_prepend(str(Path(__file__).parent.parent / "examples"))
+        from mandiri_parser_example import _transactions_from_columns
+        
+        transactions = [
+            Transaction("01/01/25", "10:30:00", "A", "ATM001", 0.0, 100.0, 1000.0),
+            Transaction("02/01/25", None, "B", "", 50.0, 0.0, 950.0),
+        ]
+        columns = ParseResult(StatementMetadata(), transactions)._transaction_columns()
+        assert _transactions_from_columns(columns) == transactions
+
+
+class TestBackends:
+    """Test cases for text extraction backends."""
+    
+    @patch('pdfparser._backends._import_pdfium', return_value=None)
+    def test_get_page_text_falls_back_to_open_pdf(self, _mock_pdfium):
+        """Test that the pdfplumber fallback reuses an opened PDF."""
+        from pdfparser._backends import get_page_text
+        
+        first, second = Mock(page_number=1), Mock(page_number=2)
+        second.extract_text.return_value = "page two"
+        mock_pdf = Mock(pages=[first, second])
+        
+        with patch('pdfplumber.open') as mock_open:
+            assert get_page_text("dummy.pdf", 1, pdf=mock_pdf) == "page two"
+        mock_open.assert_not_called()
+    
+    def test_page_extraction_is_memoized(self):
+        """Test that text and words are extracted once per page object."""
+        from pdfparser.base import _page_text, _page_words
+        
+        page = Mock()
+        page.extract_text.return_value = "header"
+        page.extract_words.return_value = [{'text': 'a', 'x0': 0.0, 'top': 0.0}]
+        
+        assert _page_text(page) == _page_text(page) == "header"
+        expected = [{'text': 'a', 'x0': 0.0, 'top': 0.0}]
+        assert _page_words(page) == _page_words(page) == expected
+        page.extract_text.assert_called_once()
+        page.extract_words.assert_called_once()
+        
+        # Different word settings extract again
+        _page_words(page, {'use_text_flow': True})
+        _page_words(page, {'use_text_flow': True})
+        assert page.extract_words.call_count == 2
+        page.extract_words.assert_called_with(use_text_flow=True)
+    
+    def test_get_page_words_matches_pdfplumber(self, tmp_path):
+        """Test that pypdfium2 words split like pdfplumber's extract_words."""
+        pytest.importorskip("pypdfium2")
+        import pdfplumber
+        from conftest import write_pdf
+        from pdfparser._backends import get_page_words
+        
+        # "DARI" starts 2pt after "TRANSFER" ends: within pdfplumber's 3pt
+        # tolerance, though pdfium reports a generated space between them
+        pdf_path = write_pdf(tmp_path / "words.pdf", [[
+            (20, 330, "01/05/25"), (110, 330, "TRANSFER"), (155.112, 330, "DARI"),
+            (110, 342, "ACME CORP"),
+        ]])
+        with pdfplumber.open(pdf_path) as pdf:
+            expected = [w['text'] for w in pdf.pages[0].extract_words()]
+        
+        assert expected == ['01/05/25', 'TRANSFERDARI', 'ACME', 'CORP']
+        assert get_page_words(pdf_path, [0])[0].text == expected
+    
+    @patch('pdfparser._backends._import_pdfium', return_value=None)
+    def test_get_page_words_without_pdfium(self, _mock_pdfium):
+        """Test that the pypdfium2 word backend reports it is unavailable."""
+        from pdfparser._backends import get_page_words
+        
+        assert get_page_words("dummy.pdf", [0]) is None
+    
+    def test_page_words_transactions_match_word_dicts(self):
+        """Test that the array path parses like the word-dict path."""
+        import numpy as np
+        from pdfparser._backends import PageWords
+        
+        words = [
+            {'text': 'Tanggal', 'x0': 20.0, 'top': 300.0},
+            {'text': '01/05/25', 'x0': 20.0, 'top': 330.0},
+            {'text': 'TRANSFER', 'x0': 110.0, 'top': 331.0},
+            {'text': '1,000.00', 'x0': 480.0, 'top': 330.0},
+            {'text': '5,000.00', 'x0': 580.0, 'top': 330.0},
+            {'text': 'ACME', 'x0': 110.0, 'top': 342.0},
+        ]
+        page_words = PageWords(
+            np.array([w['x0'] for w in words]),
+            np.array([w['top'] for w in words]),
+            [w['text'] for w in words],
+        )
+        page = Mock()
+        page.extract_words.return_value = words
+        
+        parser = BRIParser()
+        expected = parser._extract_transactions(page)
+        assert parser._extract_page_words_transactions(page_words) == expected
+        assert [t.description for t in expected] == ["TRANSFER ACME"]
+        
+        # Both paths go through the same (overridable) header search
+        assert NoTableBRIParser()._extract_page_words_transactions(page_words) == []
 
 
 class TestFactoryFunctions:
@@ -64,9 +395,71 @@ class TestFactoryFunctions:
         assert "BRI" in banks
         assert isinstance(banks, list)
     
+    @patch.object(BRIParser, 'can_parse', return_value=True)
+    @patch('pdfplumber.open')
+    def test_get_parser_reuses_default_instance(self, _mock_open, _mock_can_parse):
+        """Test that parsers with the default config are created once."""
+        factory = ParserFactory()
+        assert factory.get_parser("dummy.pdf") is factory.get_parser("dummy.pdf")
+        assert factory.get_parser("dummy.pdf", {"num_workers": 2}).num_workers == 2
+    
+    def test_list_supported_banks_does_not_instantiate(self):
+        """Test that bank names are read from the parser classes."""
+        with patch.object(BRIParser, '__init__', side_effect=AssertionError):
+            assert ParserFactory().list_supported_banks() == ["BRI"]
+    
+    def test_parser_subclass_requires_bank_name(self):
+        """Test that defining a parser without bank_name fails early."""
+        with pytest.raises(TypeError):
+            class NamelessParser(BaseBankParser):
+                pass
+        
+        with pytest.raises(TypeError):
+            class EmptyNameParser(BaseBankParser):
+                bank_name = ""
+    
+    def test_paged_parser_requires_page_extraction(self):
+        """Test that a paged parser without _extract_transactions can't be built."""
+        class UnpagedParser(PagedParserMixin, BaseBankParser):
+            bank_name = "Unpaged"
+            
+            def can_parse(self, pdf_path, pdf=None):
+                return False
+            
+            def parse(self, pdf_path, pdf=None):
+                return ParseResult(StatementMetadata(), [])
+        
+        with pytest.raises(TypeError, match="_extract_transactions"):
+            UnpagedParser()
+    
     def test_parse_pdf_function_exists(self):
         """Test that parse_pdf function is available."""
         assert callable(parse_pdf)
+    
+    def test_parse_pdfs_preserves_order(self):
+        """Test that batch parsing returns results in input order."""
+        paths = [f"statement_{i}.pdf" for i in range(10)]
+        with patch(
+            'pdfparser.factory._factory.parse', side_effect=lambda p, c: p
+        ) as mock_parse:
+            assert parse_pdfs(paths, max_workers=4) == paths
+        assert mock_parse.call_count == len(paths)
+    
+    @patch('pdfplumber.open')
+    def test_factory_opens_pdf_once(self, mock_open):
+        """Test that detection and parsing share a single opened PDF."""
+        mock_pdf = Mock()
+        mock_page = Mock(page_number=1)
+        mock_page.extract_text.return_value = "PT. BANK RAKYAT INDONESIA"
+        mock_pdf.pages = [mock_page]
+        mock_open.return_value = mock_pdf
+        
+        with patch.object(BRIParser, 'parse') as mock_parse:
+            ParserFactory().parse("dummy.pdf")
+        
+        assert mock_open.call_count == 1
+        assert mock_parse.call_args.kwargs["pdf"] is mock_pdf
+        mock_pdf.close.assert_called_once()
 
 
 class TestDataClasses:
@@ -95,6 +488,8 @@ class TestDataClasses:
         )
         assert transaction.credit == 100.0
         assert transaction.balance == 1000.0
+        assert not hasattr(transaction, "__dict__")
+        assert pickle.loads(pickle.dumps(transaction)) == transaction
     
     def test_parse_result_dataframes(self):
         """Test ParseResult DataFrame generation."""
@@ -117,4 +512,51 @@ class TestDataClasses:
         
         assert len(metadata_df) == 1
         assert len(transactions_df) == 1
-        assert transactions_df.iloc[0]["Credit"] == 100.0
\ No newline at end of file
+        assert transactions_df.iloc[0]["Credit"] == 100.0
+    
+    @pytest.mark.parametrize("without_pyarrow", [False, True])
+    def test_export_to_csv_matches_dataframe(self, tmp_path, without_pyarrow):
+        """Test that CSV export writes the same text as DataFrame.to_csv."""
+        transactions = [
+            Transaction(
+                transaction_date="01/01/25",
+                transaction_time=None,
+                description="Test, with comma",
+                teller_user_id="ATM001",
+                debit=12.5,
+                credit=0.0,
+                balance=987.5
+            )
+        ]
+        result = ParseResult(metadata=StatementMetadata(), transactions=transactions)
+        metadata_csv = tmp_path / "metadata.csv"
+        transactions_csv = tmp_path / "transactions.csv"
+        
+        # The output must not depend on whether pyarrow is installed; a None
+        # entry in sys.modules makes the pyarrow import fail
+        blocked = {"pyarrow": None} if without_pyarrow else {}
+        with patch.dict(sys.modules, blocked):
+            result.export_to_csv(str(metadata_csv), str(transactions_csv))
+        
+        with open(transactions_csv, newline="", encoding="utf-8") as f:
+            exported = f.read()
+        assert exported == result.get_transactions_df().to_csv(index=False)
+        expected = '01/01/25,,"Test, with comma",ATM001,12.5,0.0,987.5'
+        assert exported.splitlines()[1] == expected
+    
+    def test_export_to_csv_pyarrow_engine(self, tmp_path):
+        """Test the opt-in pyarrow writer and engine validation."""
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+        
+        transactions = [Transaction("01/01/25", None, "A", "ATM001", 12.5, 0.0, 987.5)]
+        result = ParseResult(metadata=StatementMetadata(), transactions=transactions)
+        metadata_csv = str(tmp_path / "metadata.csv")
+        transactions_csv = str(tmp_path / "transactions.csv")
+        
+        result.export_to_csv(metadata_csv, transactions_csv, engine="pyarrow")
+        exported = pd.read_csv(transactions_csv)
+        assert exported.loc[0, "Balance"] == 987.5
+        
+        with pytest.raises(ValueError):
+            result.export_to_csv(metadata_csv, transactions_csv, engine="arrow")